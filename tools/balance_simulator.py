@@ -9,15 +9,47 @@ Simulates games with different strategies and player counts to identify:
 - Optimal strategies
 """
 
+import functools
+import heapq
 import json
+import os
 import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional, Sequence
 from collections import defaultdict
 
 
-@dataclass
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+NUM_ERAS = 12
+MAX_MARKERS = 12
+
+# Allele income bonus indexed by marker count (4+ markers: +1, 7+: +2)
+POP_BONUS = tuple(2 if m >= 7 else 1 if m >= 4 else 0 for m in range(MAX_MARKERS + 1))
+
+# Cost modifier indexed by complexity, capped at the top tier (6+: +1, 11+: +2, 16+: +3)
+COMPLEXITY_TIER_CAP = 16
+COMPLEXITY_COST_MOD = tuple(3 if c >= 16 else 2 if c >= 11 else 1 if c >= 6 else 0
+                            for c in range(COMPLEXITY_TIER_CAP + 1))
+
+# Tags the generalist strategy treats as extinction insurance
+SURVIVAL_TAGS = frozenset({"Burrowing", "Small", "Freshwater", "Deep-Sea", "Cold-Resistant"})
+
+# Trait acquisition order for each specialist strategy
+CLADE_PATHS = {
+    "Mammalia": ["synapsid_skull", "endothermy", "fur", "mammary_glands", "live_birth", "placenta"],
+    "Aves": ["diapsid_skull", "archosaur_posture", "hollow_bones", "feathers", "flight"],
+    "Crocodilia": ["diapsid_skull", "archosaur_posture", "osteoderms", "crocodilian_form", "death_roll", "scales_reptilian"],
+    "Insecta": ["segmentation", "exoskeleton", "six_legs", "insect_flight", "metamorphosis"]
+}
+CLADE_PATH_INDEX = {clade: {tid: i for i, tid in enumerate(path)} for clade, path in CLADE_PATHS.items()}
+
+
+@dataclass(slots=True)
 class Trait:
     id: str
     name: str
@@ -25,87 +57,113 @@ class Trait:
     era_max: int
     cost: int
     complexity: int
-    tags: list[str]
+    tags: frozenset[str]
     hard_prereqs: list[str]
     soft_prereqs: list[str]
     fecundity_bonus: int
+    # Bit per tag, see load_game_data
+    tag_mask: int = 0
+    # Bit per trait: this trait's own bit and the bits of its prereqs
+    bit: int = 0
+    hard_mask: int = 0
+    soft_mask: int = 0
+    # Position in traits.json, used as the final tie-break when ranking
+    index: int = 0
+    # Strategy name -> static rank (lower is bought first)
+    priority: dict[str, int] = field(default_factory=dict)
 
 
-@dataclass 
+@dataclass(slots=True)
 class Event:
     name: str
     event_type: str
-    safe_tags: list[str]
-    doomed_tags: list[str]
+    safe_tags: frozenset[str]
+    doomed_tags: frozenset[str]
     neutral_roll: Optional[int]
+    safe_mask: int = 0
+    doomed_mask: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
+    # Trait ids in acquisition order, for reporting; membership checks use _trait_mask
     traits: list[str] = field(default_factory=list)
     markers: int = 3
     alleles: int = 0
     tiles_controlled: int = 0
     extinctions_survived: int = 0
     strategy: str = "generalist"
+    # Bitmask of self.traits and aggregates over it, kept in step by add_trait()
+    _trait_mask: int = field(default=0, repr=False)
+    _tag_mask: int = field(default=0, repr=False)
+    _complexity_cache: int = field(default=0, repr=False)
+    _fecundity_cache: int = field(default=0, repr=False)
     
-    def get_tags(self, trait_db: dict[str, Trait]) -> set[str]:
-        tags = set()
-        for tid in self.traits:
-            if tid in trait_db:
-                tags.update(trait_db[tid].tags)
-        return tags
+    def add_trait(self, trait: Trait) -> None:
+        """Acquire a trait and update the cached aggregates."""
+        self.traits.append(trait.id)
+        self._trait_mask |= trait.bit
+        self._tag_mask |= trait.tag_mask
+        self._complexity_cache += trait.complexity
+        self._fecundity_cache += trait.fecundity_bonus
     
-    def get_complexity(self, trait_db: dict[str, Trait]) -> int:
-        return sum(trait_db[tid].complexity for tid in self.traits if tid in trait_db)
+    def get_tag_mask(self) -> int:
+        return self._tag_mask
     
-    def get_fecundity_bonus(self, trait_db: dict[str, Trait]) -> int:
-        return sum(trait_db[tid].fecundity_bonus for tid in self.traits if tid in trait_db)
+    def get_complexity(self) -> int:
+        return self._complexity_cache
+    
+    def get_fecundity_bonus(self) -> int:
+        return self._fecundity_cache
     
     def can_acquire(self, trait: Trait, current_era: int) -> bool:
         if current_era < trait.era_min or current_era > trait.era_max:
             return False
-        for prereq in trait.hard_prereqs:
-            if prereq not in self.traits:
-                return False
-        return True
+        return self._trait_mask & trait.hard_mask == trait.hard_mask
     
-    def get_cost(self, trait: Trait, trait_db: dict[str, Trait]) -> int:
-        soft_count = sum(1 for p in trait.soft_prereqs if p in self.traits)
-        discount = min(soft_count, 3)
+    def get_cost(self, trait: Trait) -> int:
+        discount = min((self._trait_mask & trait.soft_mask).bit_count(), 3)
         
         # Complexity tier modifier - higher complexity = higher costs
-        complexity = self.get_complexity(trait_db)
-        if complexity >= 16:
-            complexity_mod = 3
-        elif complexity >= 11:
-            complexity_mod = 2
-        elif complexity >= 6:
-            complexity_mod = 1
-        else:
-            complexity_mod = 0
+        complexity_mod = COMPLEXITY_COST_MOD[min(self._complexity_cache, COMPLEXITY_TIER_CAP)]
         
         return max(0, trait.cost - discount + complexity_mod)
     
-    def score(self, trait_db: dict[str, Trait]) -> int:
-        complexity = self.get_complexity(trait_db)
+    def score(self) -> int:
+        complexity = self.get_complexity()
         tile_bonus = self.tiles_controlled * 3
         return self.markers * complexity + tile_bonus
 
 
-def load_game_data() -> tuple[dict[str, Trait], list[Event]]:
-    """Load traits and events from JSON files."""
-    data_dir = Path(__file__).parent.parent / "data"
-    
-    with open(data_dir / "traits.json") as f:
-        traits_data = json.load(f)
+class GameData(NamedTuple):
+    trait_db: dict[str, Trait]
+    events: list[Event]
+    # Era -> traits whose era window covers it, in traits.json order
+    traits_by_era: list[list[Trait]]
+    # (owned trait mask, era) -> available traits, filled by get_available_traits
+    available_memo: dict[tuple[int, int], tuple[Trait, ...]]
+
+
+def strategy_priority(trait: Trait, strategy: str) -> int:
+    """Static rank of a trait for a strategy, before cost is considered."""
+    if strategy == "generalist":
+        return -len(trait.tags & SURVIVAL_TAGS)
+    return CLADE_PATH_INDEX.get(strategy, {}).get(trait.id, 999)
+
+
+@functools.lru_cache(maxsize=1)
+def load_game_data() -> GameData:
+    """Load traits and events from JSON files.
     
-    with open(data_dir / "events.json") as f:
-        events_data = json.load(f)
+    The result is cached for the life of the process and must be treated
+    as read-only by callers (apart from the available_memo cache).
+    """
+    traits_data = json.loads((_DATA_DIR / "traits.json").read_bytes())
+    events_data = json.loads((_DATA_DIR / "events.json").read_bytes())
     
     traits = {}
-    for t in traits_data["traits"]:
+    for index, t in enumerate(traits_data["traits"]):
         traits[t["id"]] = Trait(
             id=t["id"],
             name=t["name"],
@@ -113,10 +171,11 @@ def load_game_data() -> tuple[dict[str, Trait], list[Event]]:
             era_max=t["era_max"],
             cost=t["cost"],
             complexity=t["complexity"],
-            tags=t["tags"],
+            tags=frozenset(t["tags"]),
             hard_prereqs=t["hard_prereqs"],
             soft_prereqs=t["soft_prereqs"],
-            fecundity_bonus=t["fecundity_bonus"]
+            fecundity_bonus=t["fecundity_bonus"],
+            index=index
         )
     
     events = []
@@ -124,32 +183,87 @@ def load_game_data() -> tuple[dict[str, Trait], list[Event]]:
         events.append(Event(
             name=e["name"],
             event_type=e["type"],
-            safe_tags=e.get("safe_tags", []),
-            doomed_tags=e.get("doomed_tags", []),
+            safe_tags=frozenset(e.get("safe_tags", [])),
+            doomed_tags=frozenset(e.get("doomed_tags", [])),
             neutral_roll=e.get("neutral_roll")
         ))
     
-    return traits, events
+    # Encode every tag as one bit so tag-set overlap is a single AND
+    all_tags = set()
+    for trait in traits.values():
+        all_tags |= trait.tags
+    for event in events:
+        all_tags |= event.safe_tags | event.doomed_tags
+    tag_bit = {tag: 1 << i for i, tag in enumerate(sorted(all_tags))}
+    
+    def tag_mask(tags: frozenset[str]) -> int:
+        return sum(tag_bit[tag] for tag in tags)
+    
+    for event in events:
+        event.safe_mask = tag_mask(event.safe_tags)
+        event.doomed_mask = tag_mask(event.doomed_tags)
+    
+    # Encode every trait as one bit so prereq checks are mask tests. Prereqs
+    # naming unknown traits get bits no player can own.
+    trait_bit = {tid: 1 << trait.index for tid, trait in traits.items()}
+    
+    def prereq_mask(prereqs: list[str]) -> int:
+        return sum(trait_bit.setdefault(tid, 1 << len(trait_bit)) for tid in set(prereqs))
+    
+    for trait in traits.values():
+        trait.bit = trait_bit[trait.id]
+        trait.hard_mask = prereq_mask(trait.hard_prereqs)
+        trait.soft_mask = prereq_mask(trait.soft_prereqs)
+        trait.tag_mask = tag_mask(trait.tags)
+        for strategy in ("generalist", *CLADE_PATHS):
+            trait.priority[strategy] = strategy_priority(trait, strategy)
+    
+    traits_by_era = [
+        [t for t in traits.values() if t.era_min <= era <= t.era_max]
+        for era in range(NUM_ERAS)
+    ]
+    
+    return GameData(traits, events, traits_by_era, {})
 
 
-def simulate_allele_roll(player: Player, trait_db: dict[str, Trait]) -> int:
-    """Simulate allele income for one era."""
-    base = random.randint(1, 6) + random.randint(1, 6)
+class _DiceBuffer:
+    """d6 rolls drawn from `random` in bulk and handed out one at a time.
+    
+    random.choices over six faces is several times cheaper per roll than
+    random.randint(1, 6), which goes through randrange on every call.
+    simulate_game refills the buffer when a game starts, so no rolls carry
+    over between games and a game depends only on the state of `random`
+    when it begins.
+    """
+    FACES = (1, 2, 3, 4, 5, 6)
     
-    if player.markers >= 7:
-        pop_bonus = 2
-    elif player.markers >= 4:
-        pop_bonus = 1
-    else:
-        pop_bonus = 0
+    def __init__(self):
+        self._buf: list[int] = []
+    
+    def refill(self, count: int) -> None:
+        """Replace any leftover rolls with `count` fresh ones."""
+        self._buf = random.choices(self.FACES, k=count)
     
+    def next(self) -> int:
+        if not self._buf:
+            self.refill(64)
+        return self._buf.pop()
+
+
+_dice = _DiceBuffer()
+
+
+def simulate_allele_roll(player: Player) -> int:
+    """Simulate allele income for one era."""
+    base = _dice.next() + _dice.next()
+    pop_bonus = POP_BONUS[player.markers]
     tile_bonus = player.tiles_controlled
-    fecundity = player.get_fecundity_bonus(trait_db)
+    fecundity = player.get_fecundity_bonus()
     
     return base + pop_bonus + tile_bonus + fecundity
 
 
-def simulate_extinction(player: Player, event: Event, trait_db: dict[str, Trait]) -> bool:
+def simulate_extinction(player: Player, event: Event) -> bool:
     """
     Simulate extinction event. Returns True if player survives with full pop.
     Modifies player.markers if they take losses.
@@ -157,21 +271,19 @@ def simulate_extinction(player: Player, event: Event, trait_db: dict[str, Trait]
     if event.event_type != "extinction":
         return True
     
-    tags = player.get_tags(trait_db)
+    tag_mask = player.get_tag_mask()
     
-    has_safe = bool(tags & set(event.safe_tags))
-    if has_safe:
+    if tag_mask & event.safe_mask:
         player.extinctions_survived += 1
         return True
     
-    has_doomed = bool(tags & set(event.doomed_tags))
-    if has_doomed:
+    if tag_mask & event.doomed_mask:
         losses = (player.markers + 1) // 2
         player.markers = max(1, player.markers - losses)
         player.extinctions_survived += 1
         return False
     
-    roll = random.randint(1, 6)
+    roll = _dice.next()
     threshold = event.neutral_roll or 4
     
     if roll >= threshold:
@@ -184,134 +296,128 @@ def simulate_extinction(player: Player, event: Event, trait_db: dict[str, Trait]
         return False
 
 
-def get_available_traits(player: Player, era: int, trait_db: dict[str, Trait]) -> list[Trait]:
-    """Get traits the player can acquire this era."""
-    available = []
-    for trait in trait_db.values():
-        if trait.id in player.traits:
-            continue
-        if player.can_acquire(trait, era):
-            available.append(trait)
+def get_available_traits(player: Player, era: int, game_data: GameData) -> tuple[Trait, ...]:
+    """Get traits the player can acquire this era.
+    
+    Availability depends only on which traits the player owns and the era,
+    and the same few hundred combinations recur across games, so results
+    are memoized on the game data.
+    """
+    key = (player._trait_mask, era)
+    available = game_data.available_memo.get(key)
+    if available is None:
+        available = tuple(
+            trait for trait in game_data.traits_by_era[era]
+            if not player._trait_mask & trait.bit and player.can_acquire(trait, era)
+        )
+        game_data.available_memo[key] = available
     return available
 
 
-def generalist_strategy(player: Player, available: list[Trait], alleles: int, trait_db: dict[str, Trait]) -> list[str]:
-    """
-    Generalist strategy: prioritize survival tags, then cheap traits.
+def _buy_in_priority_order(player: Player, available: Sequence[Trait], alleles: int,
+                           strategy: str) -> list[tuple[str, int]]:
+    """Buy traits greedily by (static priority, current cost, data order).
+    
+    Returns (trait_id, cost) pairs in purchase order; each cost already
+    reflects the purchases before it.
     """
-    survival_tags = {"Burrowing", "Small", "Freshwater", "Deep-Sea", "Cold-Resistant"}
+    if not available:
+        return []
     
-    sorted_traits = sorted(available, key=lambda t: (
-        -len(set(t.tags) & survival_tags),
-        player.get_cost(t, trait_db)
-    ))
+    heap = [(t.priority.get(strategy, 999), player.get_cost(t), t.index, t) for t in available]
+    heapq.heapify(heap)
     
     acquired = []
     remaining = alleles
-    
-    for trait in sorted_traits:
-        cost = player.get_cost(trait, trait_db)
+    saved_mask, saved_complexity = player._trait_mask, player._complexity_cache
+    
+    while heap:
+        _, cost, _, trait = heapq.heappop(heap)
+        # The ranking cost is still valid until the first purchase changes
+        # the player's complexity and soft prereqs
+        if acquired:
+            cost = player.get_cost(trait)
         if cost <= remaining:
-            acquired.append(trait.id)
-            player.traits.append(trait.id)  # Update traits so complexity recalculates
+            acquired.append((trait.id, cost))
+            # Update the mask and complexity so soft prereqs and cost tiers recalculate
+            player._trait_mask |= trait.bit
+            player._complexity_cache += trait.complexity
             remaining -= cost
     
-    # Remove temporarily added traits - they'll be added properly in simulate_game
-    for tid in acquired:
-        player.traits.remove(tid)
+    # Undo the temporary acquisitions - they'll be added properly in simulate_game
+    player._trait_mask, player._complexity_cache = saved_mask, saved_complexity
     
     return acquired
 
 
-def specialist_strategy(player: Player, available: list[Trait], alleles: int, trait_db: dict[str, Trait], target_clade: str = "Mammalia") -> list[str]:
+def generalist_strategy(player: Player, available: Sequence[Trait], alleles: int) -> list[tuple[str, int]]:
+    """
+    Generalist strategy: prioritize survival tags, then cheap traits.
+    """
+    return _buy_in_priority_order(player, available, alleles, "generalist")
+
+
+def specialist_strategy(player: Player, available: Sequence[Trait], alleles: int, target_clade: str = "Mammalia") -> list[tuple[str, int]]:
     """
     Specialist strategy: focus on building toward a specific clade.
     """
-    clade_paths = {
-        "Mammalia": ["synapsid_skull", "endothermy", "fur", "mammary_glands", "live_birth", "placenta"],
-        "Aves": ["diapsid_skull", "archosaur_posture", "hollow_bones", "feathers", "flight"],
-        "Crocodilia": ["diapsid_skull", "archosaur_posture", "osteoderms", "crocodilian_form", "death_roll", "scales_reptilian"],
-        "Insecta": ["segmentation", "exoskeleton", "six_legs", "insect_flight", "metamorphosis"]
-    }
-    
-    target_traits = clade_paths.get(target_clade, [])
-    
-    def priority(t: Trait) -> tuple:
-        in_path = t.id in target_traits
-        path_index = target_traits.index(t.id) if in_path else 999
-        return (-int(in_path), path_index, player.get_cost(t, trait_db))
-    
-    sorted_traits = sorted(available, key=priority)
-    
-    acquired = []
-    remaining = alleles
-    
-    for trait in sorted_traits:
-        cost = player.get_cost(trait, trait_db)
-        if cost <= remaining:
-            acquired.append(trait.id)
-            player.traits.append(trait.id)  # Update traits so complexity recalculates
-            remaining -= cost
-    
-    # Remove temporarily added traits - they'll be added properly in simulate_game
-    for tid in acquired:
-        player.traits.remove(tid)
-    
-    return acquired
+    return _buy_in_priority_order(player, available, alleles, target_clade)
 
 
-def simulate_game(num_players: int = 4, verbose: bool = False) -> dict:
+def simulate_game(num_players: int = 4, verbose: bool = False,
+                  game_data: Optional[GameData] = None) -> dict:
     """Simulate a complete game."""
-    trait_db, all_events = load_game_data()
+    if game_data is None:
+        game_data = load_game_data()
+    trait_db = game_data.trait_db
     
-    shuffled_events = all_events.copy()
+    # Per player per era: two income dice, one tile roll, at most one extinction roll
+    _dice.refill(num_players * NUM_ERAS * 4)
+    
+    shuffled_events = game_data.events.copy()
     random.shuffle(shuffled_events)
-    events = shuffled_events[:12]
+    events = shuffled_events[:NUM_ERAS]
     
     strategies = ["generalist", "Mammalia", "Aves", "Crocodilia"]
+    starting_alleles = random.choices(range(2, 13), k=num_players)
     players = []
     for i in range(num_players):
         strat = strategies[i % len(strategies)]
         players.append(Player(
             name=f"Player {i+1}",
             strategy=strat,
-            traits=["bilateral_symmetry"],
             markers=3,
-            alleles=random.randint(2, 12)
+            alleles=starting_alleles[i]
         ))
+        players[-1].add_trait(trait_db["bilateral_symmetry"])
     
-    for era in range(12):
+    for era in range(NUM_ERAS):
         if verbose:
             print(f"\n{'='*50}")
             print(f"ERA {era}")
             print(f"{'='*50}")
         
         for player in players:
-            income = simulate_allele_roll(player, trait_db)
+            income = simulate_allele_roll(player)
             player.alleles += income
         
         for player in players:
-            available = get_available_traits(player, era, trait_db)
-            
-            if player.strategy == "generalist":
-                acquired = generalist_strategy(player, available, player.alleles, trait_db)
-            else:
-                acquired = specialist_strategy(player, available, player.alleles, trait_db, player.strategy)
+            available = get_available_traits(player, era, game_data)
+            # Strategies differ only in their precomputed Trait.priority ranks
+            acquired = _buy_in_priority_order(player, available, player.alleles, player.strategy)
             
-            for tid in acquired:
-                trait = trait_db[tid]
-                cost = player.get_cost(trait, trait_db)
+            for tid, cost in acquired:
                 if cost <= player.alleles:
-                    player.traits.append(tid)
+                    player.add_trait(trait_db[tid])
                     player.alleles -= cost
         
         for player in players:
-            player.markers = min(12, player.markers + 1)
-            player.tiles_controlled = random.randint(1, 3)
+            player.markers = min(MAX_MARKERS, player.markers + 1)
+            player.tiles_controlled = (_dice.next() + 1) // 2  # d3
         
         event = events[era]
         for player in players:
-            survived_full = simulate_extinction(player, event, trait_db)
+            survived_full = simulate_extinction(player, event)
             if verbose and event.event_type == "extinction":
                 status = "SAFE" if survived_full else "LOST HALF"
                 print(f"  {player.name}: {status} ({player.markers} markers)")
@@ -323,13 +429,13 @@ def simulate_game(num_players: int = 4, verbose: bool = False) -> dict:
     }
     
     for player in players:
-        score = player.score(trait_db)
+        score = player.score()
         results["players"].append({
             "name": player.name,
             "strategy": player.strategy,
             "score": score,
             "markers": player.markers,
-            "complexity": player.get_complexity(trait_db),
+            "complexity": player.get_complexity(),
             "traits": len(player.traits),
             "extinctions_survived": player.extinctions_survived
         })
@@ -341,8 +447,43 @@ def simulate_game(num_players: int = 4, verbose: bool = False) -> dict:
     return results
 
 
-def run_simulation(num_games: int = 1000, num_players: int = 4) -> None:
-    """Run multiple game simulations and report statistics."""
+# Game data for pool workers, set once per process by _init_worker
+_worker_game_data: Optional[GameData] = None
+
+
+def _init_worker(game_data: GameData) -> None:
+    """Stash game data in the worker and give it an independent random stream."""
+    global _worker_game_data
+    _worker_game_data = game_data
+    random.seed(os.getpid() ^ time.time_ns())
+
+
+def _run_one_game(num_players: int) -> dict:
+    """Pool task: simulate one game using the worker's game data."""
+    return simulate_game(num_players, game_data=_worker_game_data)
+
+
+def _iter_games(num_games: int, num_players: int, workers: int, game_data: GameData):
+    """Yield results for num_games games, in a process pool if workers > 1."""
+    if workers <= 1:
+        for _ in range(num_games):
+            yield simulate_game(num_players, game_data=game_data)
+        return
+    
+    chunksize = max(1, num_games // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(game_data,)) as executor:
+        yield from executor.map(_run_one_game, [num_players] * num_games, chunksize=chunksize)
+
+
+def run_simulation(num_games: int = 1000, num_players: int = 4, workers: int = 1) -> None:
+    """Run multiple game simulations and report statistics.
+    
+    Games run in-process by default: a game takes well under a millisecond,
+    so for the usual 100-1000 game runs starting a process pool costs more
+    than it saves. Pass workers > 1 (CLI: --workers N) to farm much larger
+    runs out to a pool.
+    """    
     print(f"\n{'='*60}")
     print(f"  BALANCE SIMULATION: {num_games} games, {num_players} players")
     print(f"{'='*60}")
@@ -351,12 +492,12 @@ def run_simulation(num_games: int = 1000, num_players: int = 4) -> None:
     strategy_scores = defaultdict(list)
     strategy_survival = defaultdict(list)
     
-    for i in range(num_games):
+    game_data = load_game_data()
+    
+    for i, results in enumerate(_iter_games(num_games, num_players, workers, game_data)):
         if (i + 1) % 100 == 0:
             print(f"  Simulating game {i + 1}/{num_games}...")
         
-        results = simulate_game(num_players)
-        
         winner_strat = results["players"][0]["strategy"]
         strategy_wins[winner_strat] += 1
         
@@ -364,48 +505,46 @@ def run_simulation(num_games: int = 1000, num_players: int = 4) -> None:
             strategy_scores[player["strategy"]].append(player["score"])
             strategy_survival[player["strategy"]].append(player["markers"])
     
-    print(f"\n{'='*60}")
-    print("  RESULTS")
-    print(f"{'='*60}")
+    avg_scores = {s: (sum(v) / len(v), min(v), max(v)) for s, v in strategy_scores.items()}
+    avg_survival = {s: sum(v) / len(v) for s, v in strategy_survival.items()}
+    
+    rule = "=" * 60
+    lines = [f"\n{rule}", "  RESULTS", rule]
     
-    print("\nWin Rates by Strategy:")
+    lines.append("\nWin Rates by Strategy:")
     for strat, wins in sorted(strategy_wins.items(), key=lambda x: -x[1]):
         rate = wins / num_games * 100
-        print(f"  {strat:15} {wins:5} wins ({rate:.1f}%)")
+        lines.append(f"  {strat:15} {wins:5} wins ({rate:.1f}%)")
     
-    print("\nAverage Scores by Strategy:")
-    for strat, scores in sorted(strategy_scores.items(), key=lambda x: -sum(x[1])/len(x[1])):
-        avg = sum(scores) / len(scores)
-        min_s = min(scores)
-        max_s = max(scores)
-        print(f"  {strat:15} avg={avg:.1f}, min={min_s}, max={max_s}")
+    lines.append("\nAverage Scores by Strategy:")
+    for strat, (avg, min_s, max_s) in sorted(avg_scores.items(), key=lambda x: -x[1][0]):
+        lines.append(f"  {strat:15} avg={avg:.1f}, min={min_s}, max={max_s}")
     
-    print("\nAverage Survival (markers) by Strategy:")
-    for strat, survival in sorted(strategy_survival.items(), key=lambda x: -sum(x[1])/len(x[1])):
-        avg = sum(survival) / len(survival)
-        print(f"  {strat:15} avg={avg:.1f} markers")
+    lines.append("\nAverage Survival (markers) by Strategy:")
+    for strat, avg in sorted(avg_survival.items(), key=lambda x: -x[1]):
+        lines.append(f"  {strat:15} avg={avg:.1f} markers")
     
-    print(f"\n{'='*60}")
-    print("  BALANCE ASSESSMENT")
-    print(f"{'='*60}")
+    lines += [f"\n{rule}", "  BALANCE ASSESSMENT", rule]
     
     win_rates = {s: w/num_games for s, w in strategy_wins.items()}
     max_rate = max(win_rates.values())
     min_rate = min(win_rates.values())
     
     if max_rate - min_rate < 0.15:
-        print("\n  ✓ BALANCED: All strategies within 15% win rate difference")
+        lines.append("\n  ✓ BALANCED: All strategies within 15% win rate difference")
     else:
-        print(f"\n  ⚠ IMBALANCED: {max_rate - min_rate:.1%} spread between strategies")
+        lines.append(f"\n  ⚠ IMBALANCED: {max_rate - min_rate:.1%} spread between strategies")
         best = max(win_rates, key=win_rates.get)
         worst = min(win_rates, key=win_rates.get)
-        print(f"    Best: {best} ({win_rates[best]:.1%})")
-        print(f"    Worst: {worst} ({win_rates[worst]:.1%})")
+        lines.append(f"    Best: {best} ({win_rates[best]:.1%})")
+        lines.append(f"    Worst: {worst} ({win_rates[worst]:.1%})")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def analyze_traits() -> None:
     """Analyze trait balance and frequency."""
-    trait_db, _ = load_game_data()
+    trait_db = load_game_data().trait_db
     
     print(f"\n{'='*60}")
     print("  TRAIT ANALYSIS")
@@ -432,12 +571,10 @@ def analyze_traits() -> None:
     survival_tags = ["Burrowing", "Small", "Freshwater", "Deep-Sea", "Aquatic", "Nocturnal", "Avian", "Cold-Resistant"]
     for t in trait_db.values():
         if any(tag in survival_tags for tag in t.tags):
-            print(f"  {t.name:25} tags={t.tags}")
+            print(f"  {t.name:25} tags={sorted(t.tags)}")
 
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == "--analyze":
         analyze_traits()
     elif len(sys.argv) > 1 and sys.argv[1] == "--verbose":
@@ -449,6 +586,12 @@ if __name__ == "__main__":
             print(f"{p['name']} ({p['strategy']}): {p['score']} points")
         print(f"\nWinner: {result['winner']}")
     else:
-        num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
-        run_simulation(num_games)
+        args = sys.argv[1:]
+        workers = 1
+        if "--workers" in args:
+            i = args.index("--workers")
+            workers = int(args[i + 1])
+            del args[i:i + 2]
+        num_games = int(args[0]) if args else 1000
+        run_simulation(num_games, workers=workers)
 
@@ -6,11 +6,23 @@ Creates SVG files for trait cards, event cards, and hex tiles
 that can be printed for physical gameplay.
 """
 
+import functools
+import itertools
 import json
+import keyword
+import re
+import shutil
+import string
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+_DATA_DIR = _ROOT_DIR / "data"
+_ASSETS_DIR = _ROOT_DIR / "assets" / "cards"
+
 DECK_COLORS = {
     0: {"name": "Cambrian", "color": "#F4B8D0"},
     1: {"name": "Ordovician", "color": "#009270"},
@@ -33,113 +45,68 @@ DECK_TEXT_COLORS = {
     8: "#2d2d2d", 9: "#2d2d2d", 10: "#2d2d2d", 11: "#2d2d2d"
 }
 
+# Flat per-era lookups indexed directly by era number
+DECK_COLOR_HEX = tuple(DECK_COLORS[era]["color"] for era in range(len(DECK_COLORS)))
+DECK_NAME = tuple(DECK_COLORS[era]["name"] for era in range(len(DECK_COLORS)))
+DECK_ABBR = tuple(name[:3] for name in DECK_NAME)
+DECK_TEXT_COLOR = tuple(DECK_TEXT_COLORS[era] for era in range(len(DECK_TEXT_COLORS)))
 
-def load_data():
-    """Load all game data files."""
-    data_dir = Path(__file__).parent.parent / "data"
-    
-    with open(data_dir / "traits.json") as f:
-        traits = json.load(f)
-    with open(data_dir / "events.json") as f:
-        events = json.load(f)
-    with open(data_dir / "era_decks.json") as f:
-        decks = json.load(f)
-    
-    return traits, events, decks
-
+# Standalone card files wrap a card body in this header and footer; print
+# sheets embed the body directly.
+_CARD_SVG_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 250 350" width="250" height="350">'''
+_CARD_SVG_FOOTER = "</svg>"
 
-def generate_trait_card_svg(trait: dict, trait_lookup: dict = None, enables_lookup: dict = None) -> str:
-    """Generate SVG for a single trait card.
-    
-    Args:
-        trait: The trait data dict
-        trait_lookup: Maps trait_id -> display name
-        enables_lookup: Maps trait_id -> list of trait_ids this enables
-    """
-    era_min = trait["era_min"]
-    era_max = trait["era_max"]
-    era_color = DECK_COLORS.get(era_min, {"color": "#333"})["color"]
-    era_text_color = DECK_TEXT_COLORS.get(era_min, "#fff")
-    
-    trait_lookup = trait_lookup or {}
-    enables_lookup = enables_lookup or {}
-    
-    def get_name(trait_id):
-        """Convert trait ID to display name."""
-        if trait_id in trait_lookup:
-            return trait_lookup[trait_id]
-        return trait_id.replace("_", " ").title()
-    
-    def shorten_name(name, max_len=12):
-        """Shorten trait name for display."""
-        if len(name) <= max_len:
-            return name
-        return name[:max_len-1] + "…"
-    
-    hard_prereqs = trait.get("hard_prereqs", [])
-    soft_prereqs = trait.get("soft_prereqs", [])
-    enables = enables_lookup.get(trait["id"], [])
-    
-    # Build prereq display (REQUIRES section)
-    prereq_items = []
-    for p in hard_prereqs[:2]:
-        prereq_items.append(f'<tspan x="65" dy="10" fill="#e94560">{shorten_name(get_name(p))} ◀</tspan>')
-    for p in soft_prereqs[:1]:
-        prereq_items.append(f'<tspan x="65" dy="10" fill="#888">{shorten_name(get_name(p))} ◁</tspan>')
-    prereq_text = "".join(prereq_items) if prereq_items else '<tspan x="65" dy="10" fill="#555">—</tspan>'
-    
-    # Build enables display (UNLOCKS section)
-    enables_items = []
-    for e in enables[:3]:
-        enables_items.append(f'<tspan x="185" dy="10" fill="#27ae60">{shorten_name(get_name(e))} ▶</tspan>')
-    enables_text = "".join(enables_items) if enables_items else '<tspan x="185" dy="10" fill="#555">—</tspan>'
-    
-    tags_display = " ".join(f"[{t}]" for t in trait["tags"][:3])
-    if len(trait["tags"]) > 3:
-        tags_display += "..."
-    
-    grants = trait.get("grants", "")
-    grants_lines = []
-    for part in grants.split(". "):
-        if len(part) > 45:
-            grants_lines.append(part[:42] + "...")
-        else:
-            grants_lines.append(part)
-    grants_lines = grants_lines[:3]
-    
-    science_text = trait.get("science", "")[:80]
-    if len(trait.get("science", "")) > 80:
-        science_text += "..."
-    
-    # Count for display
-    prereq_count = len(hard_prereqs) + len(soft_prereqs)
-    enables_count = len(enables)
-    prereq_label = f"REQUIRES ({prereq_count})" if prereq_count else "REQUIRES"
-    enables_label = f"UNLOCKS ({enables_count})" if enables_count else "UNLOCKS"
-    
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 250 350" width="250" height="350">
-  <defs>
+# Trait card gradients. Print sheets hold cards from several eras, so each
+# era gets its own gradient id and a sheet declares each one only once.
+_CARD_BG_DEF = '''
     <linearGradient id="cardBg" x1="0%" y1="0%" x2="0%" y2="100%">
       <stop offset="0%" style="stop-color:#1a1a2e"/>
       <stop offset="100%" style="stop-color:#16213e"/>
-    </linearGradient>
-    <linearGradient id="eraGrad" x1="0%" y1="0%" x2="100%" y2="0%">
-      <stop offset="0%" style="stop-color:{era_color}"/>
-      <stop offset="100%" style="stop-color:{era_color}"/>
-    </linearGradient>
-  </defs>
-  
+    </linearGradient>'''
+_ERA_GRAD_DEF = '''
+    <linearGradient id="eraGrad_{era}" x1="0%" y1="0%" x2="100%" y2="0%">
+      <stop offset="0%" style="stop-color:{color}"/>
+      <stop offset="100%" style="stop-color:{color}"/>
+    </linearGradient>'''
+_ERA_GRAD_DEFS = tuple(_ERA_GRAD_DEF.format(era=era, color=color) for era, color in enumerate(DECK_COLOR_HEX))
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Compile a str.format template into a function of its fields.
+    
+    The generated function returns the template as an f-string, so the
+    template is parsed once here rather than on every card. Unknown keyword
+    arguments are ignored, matching format_map with a larger mapping.
+    """
+    pieces = []
+    fields = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if not field.isidentifier() or keyword.iskeyword(field):
+            raise ValueError(f"Unsupported template field: {field!r}")
+        if field not in fields:
+            fields.append(field)
+        pieces.append("{" + field + ("!" + conversion if conversion else "") + (":" + spec if spec else "") + "}")
+    params = ", ".join(["*", *fields, "**_"] if fields else ["**_"])
+    namespace = {}
+    exec(f"def render({params}):\n    return f{''.join(pieces)!r}\n", namespace)
+    return namespace["render"]
+
+
+_TRAIT_CARD_BODY = '''
   <rect width="250" height="350" fill="url(#cardBg)" rx="15"/>
   <rect x="5" y="5" width="240" height="340" fill="none" stroke="#e94560" stroke-width="2" rx="12"/>
   
-  <rect x="10" y="10" width="230" height="30" fill="url(#eraGrad)" rx="8"/>
-  <text x="125" y="25" font-family="Arial" font-size="10" fill="{era_text_color}" text-anchor="middle" font-weight="bold">ERA {era_min}-{era_max} ({DECK_COLORS.get(era_min, {}).get("name", "")[:3]}-{DECK_COLORS.get(era_max, {}).get("name", "")[:3]})</text>
-  <text x="30" y="35" font-family="Arial" font-size="8" fill="#f1c40f" font-weight="bold">COST: {trait["cost"]}</text>
-  <text x="220" y="35" font-family="Arial" font-size="8" fill="#9b59b6" text-anchor="end">+{trait["complexity"]} CPX</text>
+  <rect x="10" y="10" width="230" height="30" fill="url(#eraGrad_{era_min})" rx="8"/>
+  <text x="125" y="25" font-family="Arial" font-size="10" fill="{era_text_color}" text-anchor="middle" font-weight="bold">ERA {era_min}-{era_max} ({era_min_abbr}-{era_max_abbr})</text>
+  <text x="30" y="35" font-family="Arial" font-size="8" fill="#f1c40f" font-weight="bold">COST: {cost}</text>
+  <text x="220" y="35" font-family="Arial" font-size="8" fill="#9b59b6" text-anchor="end">+{complexity} CPX</text>
   
   <rect x="10" y="44" width="230" height="32" fill="#0f3460" rx="5"/>
-  <text x="125" y="66" font-family="Georgia" font-size="14" fill="#fff" text-anchor="middle" font-weight="bold">{trait["name"].upper()}</text>
+  <text x="125" y="66" font-family="Georgia" font-size="14" fill="#fff" text-anchor="middle" font-weight="bold">{name}</text>
   
   <rect x="10" y="80" width="110" height="48" fill="#0a0a15" stroke="#e94560" rx="5"/>
   <text x="65" y="92" font-family="Arial" font-size="8" fill="#e94560" text-anchor="middle" font-weight="bold">{prereq_label}</text>
@@ -154,46 +121,25 @@ def generate_trait_card_svg(trait: dict, trait_lookup: dict = None, enables_look
   
   <rect x="10" y="158" width="230" height="70" fill="#0a0a15" stroke="#27ae60" rx="5"/>
   <text x="20" y="173" font-family="Arial" font-size="9" fill="#27ae60" font-weight="bold">GRANTS:</text>
-  <text x="20" y="186" font-family="Arial" font-size="8" fill="#ccc">{grants_lines[0] if grants_lines else ""}</text>
-  <text x="20" y="198" font-family="Arial" font-size="8" fill="#ccc">{grants_lines[1] if len(grants_lines) > 1 else ""}</text>
-  <text x="20" y="210" font-family="Arial" font-size="8" fill="#ccc">{grants_lines[2] if len(grants_lines) > 2 else ""}</text>
+  <text x="20" y="186" font-family="Arial" font-size="8" fill="#ccc">{grants_1}</text>
+  <text x="20" y="198" font-family="Arial" font-size="8" fill="#ccc">{grants_2}</text>
+  <text x="20" y="210" font-family="Arial" font-size="8" fill="#ccc">{grants_3}</text>
   
   <rect x="10" y="232" width="230" height="55" fill="#0a0a15" stroke="#888" rx="5"/>
   <text x="20" y="246" font-family="Arial" font-size="8" fill="#888" font-style="italic">SCIENCE:</text>
-  <text x="20" y="258" font-family="Arial" font-size="7" fill="#666">{science_text[:55]}</text>
-  <text x="20" y="268" font-family="Arial" font-size="7" fill="#666">{science_text[55:] if len(science_text) > 55 else ""}</text>
+  <text x="20" y="258" font-family="Arial" font-size="7" fill="#666">{science_1}</text>
+  <text x="20" y="268" font-family="Arial" font-size="7" fill="#666">{science_2}</text>
   
   <rect x="10" y="291" width="230" height="20" fill="#0f3460" rx="5"/>
-  <text x="125" y="305" font-family="Arial" font-size="9" fill="#888" text-anchor="middle">[{trait.get("clade", "Various")}]</text>
+  <text x="125" y="305" font-family="Arial" font-size="9" fill="#888" text-anchor="middle">[{clade}]</text>
   
   <rect x="10" y="315" width="230" height="25" fill="#0a0a15" stroke="#444" rx="5"/>
   <text x="20" y="330" font-family="Arial" font-size="7" fill="#555">◀ Hard req  ◁ Soft req (cost-1)</text>
   <text x="230" y="330" font-family="Arial" font-size="7" fill="#555" text-anchor="end">▶ Enables</text>
-</svg>'''
-    
-    return svg
-
+'''
 
-def generate_event_card_svg(event: dict) -> str:
-    """Generate SVG for a single event card."""
-    is_extinction = event["type"] == "extinction"
-    is_positive = event["type"] == "positive"
-    border_color = "#c0392b" if is_extinction else "#27ae60" if is_positive else "#3498db"
-    
-    safe_tags = " ".join(f"[{t}]" for t in event.get("safe_tags", [])[:4])
-    doomed_tags = " ".join(f"[{t}]" for t in event.get("doomed_tags", [])[:4])
-    neutral_roll = event.get("neutral_roll", 4)
-    
-    effect_text = event.get("effect", "")[:48]
-    description = event.get("description", "")[:60]
-    
-    real_examples = event.get("real_examples", [])
-    example1 = real_examples[0][:45] if len(real_examples) > 0 else ""
-    example2 = real_examples[1][:45] if len(real_examples) > 1 else ""
-    
-    main_section = ""
-    if is_extinction:
-        main_section = f'''
+# Middle of an event card: tag outcomes for extinctions, effect text otherwise
+_EVENT_EXTINCTION_SECTION = '''
   <rect x="10" y="100" width="230" height="50" fill="#0a1a0a" stroke="#27ae60" stroke-width="2" rx="5"/>
   <text x="125" y="115" font-family="Arial" font-size="9" fill="#27ae60" text-anchor="middle" font-weight="bold">SAFE (survive)</text>
   <text x="125" y="132" font-family="Arial" font-size="7" fill="#27ae60" text-anchor="middle">{safe_tags}</text>
@@ -204,41 +150,215 @@ def generate_event_card_svg(event: dict) -> str:
   
   <rect x="10" y="210" width="230" height="25" fill="#1a1a0a" stroke="#f1c40f" rx="5"/>
   <text x="125" y="227" font-family="Arial" font-size="9" fill="#f1c40f" text-anchor="middle" font-weight="bold">NEUTRAL: Roll d6, need {neutral_roll}+</text>'''
-    else:
-        main_section = f'''
+
+_EVENT_EFFECT_SECTION = '''
   <rect x="10" y="100" width="230" height="65" fill="#0a0a15" stroke="{border_color}" rx="5"/>
   <text x="125" y="118" font-family="Arial" font-size="10" fill="{border_color}" text-anchor="middle" font-weight="bold">EFFECT:</text>
   <text x="125" y="136" font-family="Arial" font-size="8" fill="#ccc" text-anchor="middle">{effect_text}</text>
   <text x="125" y="152" font-family="Arial" font-size="7" fill="#888" text-anchor="middle" font-style="italic">{description}</text>
   
   <rect x="10" y="170" width="230" height="65" fill="#0a0505" stroke="#555" rx="5"/>'''
-    
-    examples_y = 245 if is_extinction else 185
-    
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 250 350" width="250" height="350">
+
+# Keyed by whether the event is an extinction
+_EVENT_MAIN_SECTIONS = {
+    True: _compile_template(_EVENT_EXTINCTION_SECTION),
+    False: _compile_template(_EVENT_EFFECT_SECTION),
+}
+
+_EVENT_CARD_BODY = '''
   <rect width="250" height="350" fill="#1a0a0a" rx="15"/>
   <rect x="5" y="5" width="240" height="340" fill="none" stroke="{border_color}" stroke-width="3" rx="12"/>
   
   <rect x="10" y="10" width="230" height="30" fill="{border_color}" rx="8"/>
-  <text x="125" y="30" font-family="Arial" font-size="12" fill="#fff" text-anchor="middle" font-weight="bold">{"★ EXTINCTION ★" if is_extinction else "✦ " + event["type"].upper() + " ✦"}</text>
+  <text x="125" y="30" font-family="Arial" font-size="12" fill="#fff" text-anchor="middle" font-weight="bold">{banner}</text>
   
   <rect x="10" y="45" width="230" height="50" fill="#1a0505" stroke="{border_color}" rx="5"/>
-  <text x="125" y="75" font-family="Georgia" font-size="14" fill="#fff" text-anchor="middle" font-weight="bold">{event["name"].upper()}</text>
+  <text x="125" y="75" font-family="Georgia" font-size="14" fill="#fff" text-anchor="middle" font-weight="bold">{name}</text>
   
   {main_section}
   
   <rect x="10" y="{examples_y}" width="230" height="55" fill="#0a0a1a" stroke="#9b59b6" rx="5"/>
-  <text x="125" y="{examples_y + 15}" font-family="Arial" font-size="9" fill="#9b59b6" text-anchor="middle" font-weight="bold">REAL EXAMPLES:</text>
-  <text x="20" y="{examples_y + 30}" font-family="Arial" font-size="7" fill="#bb88dd">• {example1}</text>
-  <text x="20" y="{examples_y + 42}" font-family="Arial" font-size="7" fill="#bb88dd">• {example2}</text>
+  <text x="125" y="{examples_title_y}" font-family="Arial" font-size="9" fill="#9b59b6" text-anchor="middle" font-weight="bold">REAL EXAMPLES:</text>
+  <text x="20" y="{example1_y}" font-family="Arial" font-size="7" fill="#bb88dd">• {example1}</text>
+  <text x="20" y="{example2_y}" font-family="Arial" font-size="7" fill="#bb88dd">• {example2}</text>
   
   <rect x="10" y="305" width="230" height="35" fill="#050505" stroke="#444" rx="5"/>
-  <text x="20" y="320" font-family="Arial" font-size="6" fill="#555">{event.get("science", "")[:55]}</text>
-  <text x="20" y="330" font-family="Arial" font-size="6" fill="#555">{event.get("science", "")[55:110]}</text>
-</svg>'''
+  <text x="20" y="320" font-family="Arial" font-size="6" fill="#555">{science_1}</text>
+  <text x="20" y="330" font-family="Arial" font-size="6" fill="#555">{science_2}</text>
+'''
+
+_render_trait_card_body = _compile_template(_TRAIT_CARD_BODY)
+_render_event_card_body = _compile_template(_EVENT_CARD_BODY)
+
+
+@functools.lru_cache(maxsize=1)
+def load_data():
+    """Load all game data files.
+    
+    The result is cached for the life of the process and must be treated
+    as read-only by callers.
+    """
+    traits = json.loads((_DATA_DIR / "traits.json").read_bytes())
+    events = json.loads((_DATA_DIR / "events.json").read_bytes())
+    decks = json.loads((_DATA_DIR / "era_decks.json").read_bytes())
     
-    return svg
+    return traits, events, decks
+
+
+def generate_trait_card_svg(trait: dict, trait_lookup: dict = None, enables_lookup: dict = None) -> str:
+    """Generate SVG for a single trait card.
+    
+    Args:
+        trait: The trait data dict
+        trait_lookup: Maps trait_id -> display name
+        enables_lookup: Maps trait_id -> list of trait_ids this enables
+    """
+    return (
+        _CARD_SVG_HEADER
+        + _trait_card_defs((trait["era_min"],))
+        + _generate_trait_card_body(trait, trait_lookup, enables_lookup)
+        + _CARD_SVG_FOOTER
+    )
+
+
+def _trait_card_defs(eras: Iterable[int]) -> str:
+    """<defs> block holding the gradients used by trait cards of the given eras."""
+    return "\n  <defs>" + _CARD_BG_DEF + "".join(_ERA_GRAD_DEFS[era] for era in eras) + "\n  </defs>\n  "
+
+
+def _display_name(trait_id: str, trait_lookup: dict) -> str:
+    """Convert trait ID to display name."""
+    if trait_id in trait_lookup:
+        return trait_lookup[trait_id]
+    return trait_id.replace("_", " ").title()
+
+
+def _shorten_name(name: str, max_len: int = 12) -> str:
+    """Shorten trait name for display."""
+    if len(name) <= max_len:
+        return name
+    return name[:max_len-1] + "…"
+
+
+def _generate_trait_card_body(trait: dict, trait_lookup: dict = None, enables_lookup: dict = None) -> str:
+    """Generate the contents of a trait card's <svg> element.
+    
+    Args:
+        trait: The trait data dict
+        trait_lookup: Maps trait_id -> display name
+        enables_lookup: Maps trait_id -> list of trait_ids this enables
+    """
+    era_min = trait["era_min"]
+    era_max = trait["era_max"]
+    
+    trait_lookup = trait_lookup or {}
+    enables_lookup = enables_lookup or {}
+    
+    hard_prereqs = trait.get("hard_prereqs", [])
+    soft_prereqs = trait.get("soft_prereqs", [])
+    enables = enables_lookup.get(trait["id"], [])
+    
+    # Build prereq display (REQUIRES section)
+    prereq_items = []
+    for p in hard_prereqs[:2]:
+        prereq_items.append(f'<tspan x="65" dy="10" fill="#e94560">{_shorten_name(_display_name(p, trait_lookup))} ◀</tspan>')
+    for p in soft_prereqs[:1]:
+        prereq_items.append(f'<tspan x="65" dy="10" fill="#888">{_shorten_name(_display_name(p, trait_lookup))} ◁</tspan>')
+    prereq_text = "".join(prereq_items) if prereq_items else '<tspan x="65" dy="10" fill="#555">—</tspan>'
+    
+    # Build enables display (UNLOCKS section)
+    enables_items = []
+    for e in enables[:3]:
+        enables_items.append(f'<tspan x="185" dy="10" fill="#27ae60">{_shorten_name(_display_name(e, trait_lookup))} ▶</tspan>')
+    enables_text = "".join(enables_items) if enables_items else '<tspan x="185" dy="10" fill="#555">—</tspan>'
+    
+    tags = trait["tags"]
+    tags_display = " ".join(f"[{t}]" for t in tags[:3]) + ("..." if len(tags) > 3 else "")
+    
+    grants = trait.get("grants", "")
+    if grants:
+        grants_lines = [part[:42] + "..." if len(part) > 45 else part for part in grants.split(". ", 3)[:3]]
+    else:
+        grants_lines = []
+    
+    science = trait.get("science", "")
+    science_text = science[:80] + ("..." if len(science) > 80 else "")
+    
+    # Count for display
+    prereq_count = len(hard_prereqs) + len(soft_prereqs)
+    enables_count = len(enables)
+    prereq_label = f"REQUIRES ({prereq_count})" if prereq_count else "REQUIRES"
+    enables_label = f"UNLOCKS ({enables_count})" if enables_count else "UNLOCKS"
+    
+    return _render_trait_card_body(
+        era_text_color=DECK_TEXT_COLOR[era_min],
+        era_min=era_min,
+        era_max=era_max,
+        era_min_abbr=DECK_ABBR[era_min],
+        era_max_abbr=DECK_ABBR[era_max],
+        cost=trait["cost"],
+        complexity=trait["complexity"],
+        name=trait["name"].upper(),
+        prereq_label=prereq_label,
+        prereq_text=prereq_text,
+        enables_label=enables_label,
+        enables_text=enables_text,
+        tags_display=tags_display,
+        grants_1=grants_lines[0] if grants_lines else "",
+        grants_2=grants_lines[1] if len(grants_lines) > 1 else "",
+        grants_3=grants_lines[2] if len(grants_lines) > 2 else "",
+        science_1=science_text[:55],
+        science_2=science_text[55:] if len(science_text) > 55 else "",
+        clade=trait.get("clade", "Various"),
+    )
+
+
+def generate_event_card_svg(event: dict) -> str:
+    """Generate SVG for a single event card."""
+    return _CARD_SVG_HEADER + _generate_event_card_body(event) + _CARD_SVG_FOOTER
+
+
+def _generate_event_card_body(event: dict) -> str:
+    """Generate the contents of an event card's <svg> element."""
+    event_type = event["type"]
+    is_extinction = event_type == "extinction"
+    is_positive = event_type == "positive"
+    border_color = "#c0392b" if is_extinction else "#27ae60" if is_positive else "#3498db"
+    
+    safe_tags = " ".join(f"[{t}]" for t in event.get("safe_tags", [])[:4])
+    doomed_tags = " ".join(f"[{t}]" for t in event.get("doomed_tags", [])[:4])
+    neutral_roll = event.get("neutral_roll", 4)
+    
+    effect_text = event.get("effect", "")[:48]
+    description = event.get("description", "")[:60]
+    
+    real_examples = event.get("real_examples", [])
+    example1 = real_examples[0][:45] if len(real_examples) > 0 else ""
+    example2 = real_examples[1][:45] if len(real_examples) > 1 else ""
+    
+    examples_y = 245 if is_extinction else 185
+    science = event.get("science", "")
+    
+    fields = {
+        "border_color": border_color,
+        "banner": "★ EXTINCTION ★" if is_extinction else "✦ " + event_type.upper() + " ✦",
+        "name": event["name"].upper(),
+        "safe_tags": safe_tags,
+        "doomed_tags": doomed_tags,
+        "neutral_roll": neutral_roll,
+        "effect_text": effect_text,
+        "description": description,
+        "examples_y": examples_y,
+        "examples_title_y": examples_y + 15,
+        "example1_y": examples_y + 30,
+        "example2_y": examples_y + 42,
+        "example1": example1,
+        "example2": example2,
+        "science_1": science[:55],
+        "science_2": science[55:110],
+    }
+    fields["main_section"] = _EVENT_MAIN_SECTIONS[is_extinction](**fields)
+    return _render_event_card_body(**fields)
 
 
 def build_enables_lookup(traits: list) -> dict:
@@ -246,77 +366,119 @@ def build_enables_lookup(traits: list) -> dict:
     
     A trait enables another if it appears in that trait's hard_prereqs or soft_prereqs.
     """
-    enables = {}
-    for trait in traits:
-        trait_id = trait["id"]
-        enables[trait_id] = []
+    enables = {t["id"]: [] for t in traits}
     
     for trait in traits:
-        for prereq_id in trait.get("hard_prereqs", []):
-            if prereq_id in enables:
-                enables[prereq_id].append(trait["id"])
-        for prereq_id in trait.get("soft_prereqs", []):
+        trait_id = trait["id"]
+        for prereq_id in trait.get("hard_prereqs", []) + trait.get("soft_prereqs", []):
             if prereq_id in enables:
-                enables[prereq_id].append(trait["id"])
+                enables[prereq_id].append(trait_id)
     
     return enables
 
 
-def generate_all_cards(output_dir: Optional[Path] = None) -> None:
-    """Generate all card SVGs."""
+def _write_svg(path: Path, body: bytes) -> None:
+    """Write one UTF-8 encoded SVG file."""
+    path.write_bytes(body)
+
+
+def _write_svgs(filepaths: list[Path], svg_bodies: list[bytes]) -> None:
+    """Write SVG files concurrently.
+    
+    Rendering is cheap next to the per-file syscalls, so a thread pool that
+    overlaps the writes beats farming the rendering out to processes.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_write_svg, filepaths, svg_bodies))
+
+
+@functools.lru_cache(maxsize=1)
+def _prepare_lookups() -> tuple[dict, dict]:
+    """Build (trait_lookup, enables_lookup) for the loaded traits, once."""
+    traits, _, _ = load_data()
+    trait_lookup = {t["id"]: t["name"] for t in traits["traits"]}
+    enables_lookup = build_enables_lookup(traits["traits"])
+    return trait_lookup, enables_lookup
+
+
+def generate_all_cards(output_dir: Optional[Path] = None, archive: bool = False) -> None:
+    """Generate all card SVGs.
+    
+    With archive=True the cards are written into a single cards.zip in
+    output_dir (same traits/, events/, event_backs/ layout) instead of one
+    file per card.
+    """
     if output_dir is None:
-        output_dir = Path(__file__).parent.parent / "generated_cards"
+        output_dir = _ROOT_DIR / "generated_cards"
     
     output_dir.mkdir(exist_ok=True)
-    (output_dir / "traits").mkdir(exist_ok=True)
-    (output_dir / "events").mkdir(exist_ok=True)
     
     traits, events, _ = load_data()
+    trait_lookup, enables_lookup = _prepare_lookups()
     
-    trait_lookup = {t["id"]: t["name"] for t in traits["traits"]}
-    enables_lookup = build_enables_lookup(traits["traits"])
+    names = []
+    svg_bodies = []
     
     print(f"Generating {len(traits['traits'])} trait cards...")
     for trait in traits["traits"]:
-        svg = generate_trait_card_svg(trait, trait_lookup, enables_lookup)
-        filepath = output_dir / "traits" / f"{trait['id']}.svg"
-        with open(filepath, "w") as f:
-            f.write(svg)
+        names.append(f"traits/{trait['id']}.svg")
+        svg_bodies.append(generate_trait_card_svg(trait, trait_lookup, enables_lookup).encode("utf-8"))
     
     print(f"Generating {len(events['events'])} event cards...")
     for event in events["events"]:
-        svg = generate_event_card_svg(event)
         event_id = event.get("id", event["name"].lower().replace(" ", "_").replace("-", "_"))
-        filepath = output_dir / "events" / f"{event_id}.svg"
-        with open(filepath, "w") as f:
-            f.write(svg)
-    
-    (output_dir / "event_backs").mkdir(exist_ok=True)
-    assets_dir = Path(__file__).parent.parent / "assets" / "cards"
-    
-    import shutil
-    extinction_back = assets_dir / "event_back_extinction.svg"
-    other_back = assets_dir / "event_back_other.svg"
-    if extinction_back.exists():
-        shutil.copy(extinction_back, output_dir / "event_backs" / "extinction_back.svg")
-    if other_back.exists():
-        shutil.copy(other_back, output_dir / "event_backs" / "other_back.svg")
+        names.append(f"events/{event_id}.svg")
+        svg_bodies.append(generate_event_card_svg(event).encode("utf-8"))
+    
+    backs = [
+        (_ASSETS_DIR / "event_back_extinction.svg", "event_backs/extinction_back.svg"),
+        (_ASSETS_DIR / "event_back_other.svg", "event_backs/other_back.svg"),
+    ]
+    backs = [(src, name) for src, name in backs if src.exists()]
+    
+    if archive:
+        destination = output_dir / "cards.zip"
+        # Level 1 keeps compression cheap; SVG text still shrinks several-fold
+        with zipfile.ZipFile(destination, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            for name, svg in zip(names, svg_bodies):
+                zf.writestr(name, svg)
+            for src, name in backs:
+                zf.write(src, name)
+    else:
+        destination = output_dir
+        for subdir in ("traits", "events", "event_backs"):
+            (output_dir / subdir).mkdir(exist_ok=True)
+        _write_svgs([output_dir / name for name in names], svg_bodies)
+        for src, name in backs:
+            shutil.copy(src, output_dir / name)
+    
+    location = "as {}/ entries in cards.zip" if archive else "in /{}"
+    print(f"\nCards generated in: {destination}")
+    print(f"  - {len(traits['traits'])} trait cards {location.format('traits')}")
+    print(f"  - {len(events['events'])} event cards {location.format('events')}")
+    print(f"  - {len(backs)} event back designs {location.format('event_backs')}")
+
+
+_SVG_INNER_RE = re.compile(r"<svg[^>]*>(.*)</svg>", re.DOTALL)
+
+
+def _strip_svg_wrapper(svg: str) -> str:
+    """Return the contents of an SVG document's outer <svg> element.
     
-    print(f"\nCards generated in: {output_dir}")
-    print(f"  - {len(traits['traits'])} trait cards in /traits")
-    print(f"  - {len(events['events'])} event cards in /events")
-    print(f"  - 2 event back designs in /event_backs")
+    Only needed for SVGs we don't render ourselves (the event back assets).
+    """
+    return _SVG_INNER_RE.search(svg).group(1)
 
 
 def generate_print_sheets(output_dir: Optional[Path] = None) -> None:
     """Generate print sheets for all cards (A4/Letter, 3x3 grid per sheet)."""
     if output_dir is None:
-        output_dir = Path(__file__).parent.parent / "generated_cards" / "print_sheets"
+        output_dir = _ROOT_DIR / "generated_cards" / "print_sheets"
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
     traits, events, _ = load_data()
-    trait_lookup = {t["id"]: t["name"] for t in traits["traits"]}
+    trait_lookup, enables_lookup = _prepare_lookups()
     
     cards_per_row = 3
     cards_per_col = 3
@@ -329,51 +491,55 @@ def generate_print_sheets(output_dir: Optional[Path] = None) -> None:
     sheet_width = cards_per_row * (card_width + margin) + margin
     sheet_height = cards_per_col * (card_height + margin) + margin
     
-    def create_sheet(cards: list, sheet_name: str) -> None:
+    # Opening <g> for each grid slot, row-major
+    slot_openers = [
+        b'<g transform="translate(%d, %d)">' % (margin + col * (card_width + margin), margin + row * (card_height + margin))
+        for row in range(cards_per_col)
+        for col in range(cards_per_row)
+    ]
+    
+    sheet_paths = []
+    sheet_bodies = []
+    
+    def create_sheet(cards: Iterable[bytes], sheet_name: str, defs: str = "") -> None:
+        """Lay out encoded card bodies (SVG contents without the <svg> wrapper) on one sheet.
+        
+        defs is emitted once at sheet level for anything the bodies reference.
+        """
         svg_header = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {sheet_width} {sheet_height}" width="{sheet_width}" height="{sheet_height}">
+<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {sheet_width} {sheet_height}" width="{sheet_width}" height="{sheet_height}">{defs}
   <rect width="{sheet_width}" height="{sheet_height}" fill="#ffffff"/>
-'''
-        cards_content = []
-        for i, card_svg in enumerate(cards):
-            row = i // cards_per_row
-            col = i % cards_per_row
-            x = margin + col * (card_width + margin)
-            y = margin + row * (card_height + margin)
-            
-            inner = card_svg.split("<svg")[1].split(">", 1)[1].rsplit("</svg>", 1)[0]
-            cards_content.append(f'<g transform="translate({x}, {y})">{inner}</g>')
+'''.encode("utf-8")
+        cards_content = [opener + inner + b"</g>" for opener, inner in zip(slot_openers, cards)]
         
-        with open(output_dir / sheet_name, "w") as f:
-            f.write(svg_header + "\n".join(cards_content) + "</svg>")
+        sheet_paths.append(output_dir / sheet_name)
+        sheet_bodies.append(svg_header + b"\n".join(cards_content) + b"</svg>")
     
-    enables_lookup = build_enables_lookup(traits["traits"])
-    trait_cards = [generate_trait_card_svg(t, trait_lookup, enables_lookup) for t in traits["traits"]]
-    for i in range(0, len(trait_cards), cards_per_sheet):
-        sheet_num = i // cards_per_sheet + 1
+    trait_list = traits["traits"]
+    trait_cards = [_generate_trait_card_body(t, trait_lookup, enables_lookup).encode("utf-8") for t in trait_list]
+    for sheet_num, i in enumerate(range(0, len(trait_cards), cards_per_sheet), 1):
         batch = trait_cards[i:i + cards_per_sheet]
-        create_sheet(batch, f"traits_sheet_{sheet_num:02d}.svg")
+        sheet_eras = sorted({t["era_min"] for t in trait_list[i:i + cards_per_sheet]})
+        create_sheet(batch, f"traits_sheet_{sheet_num:02d}.svg", _trait_card_defs(sheet_eras))
     
-    event_cards = [generate_event_card_svg(e) for e in events["events"]]
-    for i in range(0, len(event_cards), cards_per_sheet):
-        sheet_num = i // cards_per_sheet + 1
+    event_cards = [_generate_event_card_body(e).encode("utf-8") for e in events["events"]]
+    for sheet_num, i in enumerate(range(0, len(event_cards), cards_per_sheet), 1):
         batch = event_cards[i:i + cards_per_sheet]
         create_sheet(batch, f"events_sheet_{sheet_num:02d}.svg")
     
-    assets_dir = Path(__file__).parent.parent / "assets" / "cards"
-    extinction_back = assets_dir / "event_back_extinction.svg"
-    other_back = assets_dir / "event_back_other.svg"
+    extinction_back = _ASSETS_DIR / "event_back_extinction.svg"
+    other_back = _ASSETS_DIR / "event_back_other.svg"
     
     if extinction_back.exists() and other_back.exists():
-        with open(extinction_back) as f:
-            ext_svg = f.read()
-        with open(other_back) as f:
-            other_svg = f.read()
-        
-        ext_cards = [ext_svg] * 7
-        other_cards = [other_svg] * 9
-        create_sheet(ext_cards + other_cards[:2], "event_backs_sheet_01.svg")
-        create_sheet(other_cards[2:], "event_backs_sheet_02.svg")
+        ext_inner = _strip_svg_wrapper(extinction_back.read_text()).encode("utf-8")
+        other_inner = _strip_svg_wrapper(other_back.read_text()).encode("utf-8")
+        create_sheet(
+            itertools.chain(itertools.repeat(ext_inner, 7), itertools.repeat(other_inner, 2)),
+            "event_backs_sheet_01.svg",
+        )
+        create_sheet(itertools.repeat(other_inner, 7), "event_backs_sheet_02.svg")
+    
+    _write_svgs(sheet_paths, sheet_bodies)
     
     num_trait_sheets = (len(trait_cards) + cards_per_sheet - 1) // cards_per_sheet
     num_event_sheets = (len(event_cards) + cards_per_sheet - 1) // cards_per_sheet
@@ -387,11 +553,12 @@ def generate_print_sheets(output_dir: Optional[Path] = None) -> None:
 if __name__ == "__main__":
     import sys
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--sheets":
-        generate_all_cards()
+    archive = "--archive" in sys.argv[1:]
+    
+    if "--sheets" in sys.argv[1:]:
+        generate_all_cards(archive=archive)
         generate_print_sheets()
-    elif len(sys.argv) > 1 and sys.argv[1] == "--print-only":
+    elif "--print-only" in sys.argv[1:]:
         generate_print_sheets()
     else:
-        generate_all_cards()
-
+        generate_all_cards(archive=archive)
@@ -3,23 +3,25 @@
 Organism Matcher - Find the closest real organism to a player's traits.
 
 Uses Jaccard similarity to compare trait vectors between the player's
-current traits and known organisms in the database.
+current traits and known organisms in the database. Trait sets are
+encoded as integer bitmasks so intersection and union sizes are popcounts.
 """
 
+import functools
+import heapq
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
+_DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@functools.lru_cache(maxsize=1)
 def load_data() -> tuple[dict, dict]:
     """Load organisms and traits databases."""
-    data_dir = Path(__file__).parent.parent / "data"
-    
-    with open(data_dir / "organisms.json") as f:
-        organisms_data = json.load(f)
-    
-    with open(data_dir / "traits.json") as f:
-        traits_data = json.load(f)
+    organisms_data = json.loads((_DATA_DIR / "organisms.json").read_bytes())
+    traits_data = json.loads((_DATA_DIR / "traits.json").read_bytes())
     
     return organisms_data, traits_data
 
@@ -29,10 +31,73 @@ def jaccard_similarity(set1: set, set2: set) -> float:
     if not set1 and not set2:
         return 0.0
     intersection = len(set1 & set2)
-    union = len(set1 | set2)
+    union = len(set1) + len(set2) - intersection
     return intersection / union if union > 0 else 0.0
 
 
+def build_organism_index(organisms: list[dict]) -> tuple[dict[str, int], list[tuple[dict, int, int, int, int]]]:
+    """
+    Encode each organism's traits as a bitmask over the organisms' trait vocabulary.
+    
+    Returns:
+        (trait_bit, entries) where trait_bit maps trait ID -> bit and each
+        entry is (organism, trait_mask, trait_count, era_min, era_max)
+    """
+    trait_bit = {}
+    for organism in organisms:
+        for trait in organism["traits"]:
+            trait_bit.setdefault(trait, 1 << len(trait_bit))
+    
+    entries = []
+    for organism in organisms:
+        era_min, era_max = organism["era_range"]
+        organism_mask = encode_traits(organism["traits"], trait_bit)
+        entries.append((organism, organism_mask, organism_mask.bit_count(), era_min, era_max))
+    return trait_bit, entries
+
+
+@functools.lru_cache(maxsize=1)
+def _organism_index() -> tuple[dict[str, int], list[tuple[dict, int, int, int, int]]]:
+    """Organism index for the bundled database, built once per process."""
+    organisms_data, _ = load_data()
+    return build_organism_index(organisms_data["organisms"])
+
+
+def encode_traits(traits: Iterable[str], trait_bit: dict[str, int]) -> int:
+    """
+    Encode trait IDs as a bitmask. IDs missing from trait_bit get fresh bits
+    above the vocabulary, so they still count toward the union.
+    """
+    mask = 0
+    extra_bit = 1 << len(trait_bit)
+    for trait in set(traits):
+        if trait in trait_bit:
+            mask |= trait_bit[trait]
+        else:
+            mask |= extra_bit
+            extra_bit <<= 1
+    return mask
+
+
+def score_organisms(
+    organism_index: list[tuple[dict, int, int, int, int]],
+    player_mask: int,
+    current_era: int
+) -> list[tuple[float, dict]]:
+    """Jaccard similarity of player_mask to every organism alive in current_era."""
+    player_count = player_mask.bit_count()
+    scored = []
+    for organism, organism_mask, organism_count, era_min, era_max in organism_index:
+        if not (era_min <= current_era <= era_max):
+            continue
+        
+        intersection = (player_mask & organism_mask).bit_count()
+        union = player_count + organism_count - intersection
+        similarity = intersection / union if union > 0 else 0.0
+        scored.append((similarity, organism))
+    return scored
+
+
 def find_closest_organisms(
     player_traits: list[str],
     current_era: int = 11,
@@ -49,32 +114,26 @@ def find_closest_organisms(
     Returns:
         List of organism matches with similarity scores
     """
-    organisms_data, _ = load_data()
+    trait_bit, organism_index = _organism_index()
+    
     player_set = set(player_traits)
+    player_mask = encode_traits(player_set, trait_bit)
+    
+    scored = score_organisms(organism_index, player_mask, current_era)
     
+    # Only the returned matches need the trait-by-trait breakdown
     matches = []
-    for organism in organisms_data["organisms"]:
-        era_min, era_max = organism["era_range"]
-        if not (era_min <= current_era <= era_max):
-            continue
-        
+    for similarity, organism in heapq.nlargest(top_n, scored, key=lambda x: x[0]):
         organism_set = set(organism["traits"])
-        similarity = jaccard_similarity(player_set, organism_set)
-        
-        shared_traits = player_set & organism_set
-        missing_traits = organism_set - player_set
-        extra_traits = player_set - organism_set
-        
         matches.append({
             "organism": organism,
             "similarity": similarity,
-            "shared_traits": list(shared_traits),
-            "missing_for_exact": list(missing_traits),
-            "extra_traits": list(extra_traits)
+            "shared_traits": list(player_set & organism_set),
+            "missing_for_exact": list(organism_set - player_set),
+            "extra_traits": list(player_set - organism_set)
         })
     
-    matches.sort(key=lambda x: x["similarity"], reverse=True)
-    return matches[:top_n]
+    return matches
 
 
 def display_match(match: dict, rank: int) -> None: